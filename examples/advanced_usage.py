@@ -50,7 +50,7 @@ class CustomFactorProvider(FactorProvider):
         ]
 
         if category:
-            return [f for f in custom_factors if f.category.lower() == category.lower()]
+            return [f for f in custom_factors if f.category_lower == category.lower()]
         return custom_factors
 
     def get_categories(self):
@@ -108,12 +108,12 @@ def main():
         # Try to find factors for this activity
         matching_factors = [
             f for f in all_factors
-            if f.category.lower() in activity.activity_type.lower().replace(" usage", "")
+            if f.category_lower in activity.activity_type_lower.replace(" usage", "")
         ]
 
         if not matching_factors:
             # Fallback to any electricity factors for demo
-            matching_factors = [f for f in all_factors if "electricity" in f.category.lower()]
+            matching_factors = [f for f in all_factors if "electricity" in f.category_lower]
 
         if matching_factors:
             record = calculator.calculate_emissions(
@@ -154,10 +154,11 @@ def main():
 
         # Show factor sources used
         print("\nEmission Factors Used:")
-        all_sources = set()
-        for record in records:
-            for factor in record.factors_applied:
-                all_sources.add(f"{factor.category}: {factor.source}")
+        all_sources = {
+            f"{factor.category}: {factor.source}"
+            for record in records
+            for factor in record.factors_applied
+        }
         for source in sorted(all_sources):
             print(f"  - {source}")
 
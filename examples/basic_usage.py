@@ -2,7 +2,11 @@
 
 from datetime import datetime
 
-from ghg_emissions.calculator import EmissionCalculator
+from ghg_emissions.calculator import (
+    EmissionCalculator,
+    build_category_index,
+    match_factors_by_category,
+)
 from ghg_emissions.factors import FactorLoader
 from ghg_emissions.models import ActivityData, ReportData, Scope, Unit
 from ghg_emissions.reporting import ReportGenerator
@@ -61,12 +65,10 @@ def main():
 
     # Calculate emissions for each activity
     records = []
+    category_index = build_category_index(factors)
     for activity in activities:
         # Find matching factors
-        matching_factors = [
-            f for f in factors
-            if f.category.lower() in activity.activity_type.lower()
-        ]
+        matching_factors = match_factors_by_category(category_index, activity.activity_type)
 
         if matching_factors:
             record = calculator.calculate_emissions(
@@ -1,5 +1,15 @@
 # Calculator package
 
-from .calculator import EmissionCalculator
+from .calculator import (
+    EmissionCalculator,
+    FactorTable,
+    build_category_index,
+    match_factors_by_category,
+)
 
-__all__ = ["EmissionCalculator"]
\ No newline at end of file
+__all__ = [
+    "EmissionCalculator",
+    "FactorTable",
+    "build_category_index",
+    "match_factors_by_category",
+]
\ No newline at end of file
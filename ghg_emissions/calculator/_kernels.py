@@ -0,0 +1,68 @@
+"""Compiled numeric kernels for emission calculations.
+
+Numba is optional (install with the ``perf`` extra); without it the
+kernel falls back to plain NumPy vector operations.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - depends on optional extra
+    njit = None
+    prange = range
+
+
+def _emission_kernel_py(quantity, values, gwps):
+    """Compute (amounts, co2e, total) for one activity over factor columns."""
+    amounts = np.empty_like(values)
+    co2e = np.empty_like(values)
+    total = 0.0
+    for i in range(values.shape[0]):
+        amount = quantity * values[i]
+        amounts[i] = amount
+        equivalent = amount * gwps[i]
+        co2e[i] = equivalent
+        total += equivalent
+    return amounts, co2e, total
+
+
+def _aggregate_kernel_py(quantities, type_idx, csr_values, offsets):
+    """Per-activity CO2e totals: gather the activity's category slice of the
+    CSR-sorted factor values, sum it, and scale by quantity.
+
+    ``type_idx`` entries of -1 (unknown category) contribute 0.
+    """
+    out = np.empty_like(quantities)
+    for i in prange(quantities.shape[0]):
+        c = type_idx[i]
+        total = 0.0
+        if c >= 0:
+            for j in range(offsets[c], offsets[c + 1]):
+                total += csr_values[j]
+        out[i] = quantities[i] * total
+    return out
+
+
+if njit is not None:
+    emission_kernel = njit(cache=True, fastmath=True)(_emission_kernel_py)
+    aggregate_kernel = njit(parallel=True, fastmath=True, cache=True)(
+        _aggregate_kernel_py
+    )
+else:
+    def emission_kernel(quantity, values, gwps):
+        """NumPy fallback for the compiled emission kernel."""
+        amounts = quantity * values
+        co2e = amounts * gwps
+        return amounts, co2e, float(co2e.sum())
+
+    def aggregate_kernel(quantities, type_idx, csr_values, offsets):
+        """NumPy fallback for the compiled aggregation kernel."""
+        lengths = np.diff(offsets)
+        cat_of_value = np.repeat(np.arange(lengths.shape[0]), lengths)
+        sums = np.bincount(
+            cat_of_value, weights=csr_values, minlength=lengths.shape[0]
+        )
+        # Sentinel slot so type_idx == -1 (unknown category) reads 0.0
+        sums = np.append(sums, 0.0)
+        return quantities * sums[type_idx]
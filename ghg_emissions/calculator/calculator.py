@@ -1,8 +1,13 @@
 """Emission calculation logic."""
 
-import uuid
-from typing import Dict, List, Optional
+import itertools
+import os
+import time
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
+from ._kernels import aggregate_kernel, emission_kernel
 from ..models import (
     ActivityData,
     CalculationRecord,
@@ -23,6 +28,138 @@ GWP_FACTORS = {
     GasType.CO2E: 1.0,  # Already equivalent
 }
 
+# Stable position of each gas in the vectorized GWP lookup table, stored
+# on the enum members so hot paths avoid a dict hash per factor
+for _i, _gas in enumerate(GasType):
+    _gas._idx = _i
+
+
+# Process-local calculation IDs: a pid/start-time prefix plus a counter is
+# unique enough for audit trails and far cheaper than uuid4 per record
+_calc_counter = itertools.count()
+_calc_prefix = f"{os.getpid():x}-{int(time.time()):x}-"
+
+
+def _next_calculation_id() -> str:
+    """Generate a cheap process-unique calculation ID."""
+    return _calc_prefix + format(next(_calc_counter), 'x')
+
+
+def build_category_index(factors: List[EmissionFactor]) -> Dict[str, List[EmissionFactor]]:
+    """
+    Build an inverted index from lowercase category tokens to factors.
+
+    Built once per factor list, the index turns factor matching into a
+    dictionary lookup per activity token instead of a substring scan over
+    every factor for every activity.
+    """
+    index: Dict[str, List[EmissionFactor]] = {}
+    for factor in factors:
+        for token in factor.category_lower.split():
+            index.setdefault(token, []).append(factor)
+    return index
+
+
+def match_factors_by_category(
+    index: Dict[str, List[EmissionFactor]],
+    activity_type: str,
+) -> List[EmissionFactor]:
+    """Look up factors whose category shares a token with the activity type."""
+    matched: List[EmissionFactor] = []
+    seen = set()
+    for token in activity_type.lower().split():
+        for factor in index.get(token, ()):
+            if id(factor) not in seen:
+                seen.add(id(factor))
+                matched.append(factor)
+    return matched
+
+
+def _factor_arrays(factors: List[EmissionFactor]) -> Tuple[np.ndarray, np.ndarray]:
+    """Build structure-of-arrays columns (values, gas indices) for factors."""
+    n = len(factors)
+    values = np.fromiter((f.value for f in factors), dtype=np.float64, count=n)
+    gas_idx = np.fromiter((f.gas._idx for f in factors), dtype=np.intp, count=n)
+    return values, gas_idx
+
+
+class FactorTable:
+    """
+    Structure-of-arrays view over a list of emission factors.
+
+    Building the table once converts the object layout into contiguous
+    NumPy columns, so batch calculations reuse the columns instead of
+    re-reading one attribute at a time per factor.
+    """
+
+    __slots__ = ('factors', 'values', 'gas_idx', 'category_idx',
+                 'category_to_idx', '_value_sums', '_csr_order', '_csr_offsets')
+
+    def __init__(self, factors, values, gas_idx, category_idx, category_to_idx):
+        self.factors = factors
+        self.values = values
+        self.gas_idx = gas_idx
+        self.category_idx = category_idx
+        self.category_to_idx = category_to_idx
+        self._value_sums = None
+        self._csr_order = None
+        self._csr_offsets = None
+
+    @classmethod
+    def from_factors(cls, factors: List[EmissionFactor]) -> "FactorTable":
+        """Convert a factor list into SoA columns with interned categories."""
+        values, gas_idx = _factor_arrays(factors)
+        category_to_idx: Dict[str, int] = {}
+        category_idx = np.empty(len(factors), dtype=np.int32)
+        for i, factor in enumerate(factors):
+            category_idx[i] = category_to_idx.setdefault(
+                factor.category, len(category_to_idx)
+            )
+        return cls(list(factors), values, gas_idx, category_idx, category_to_idx)
+
+    def __len__(self) -> int:
+        return len(self.factors)
+
+    def category_value_sums(self) -> np.ndarray:
+        """Per-category sums of factor values, computed once."""
+        if self._value_sums is None:
+            self._value_sums = np.bincount(
+                self.category_idx,
+                weights=self.values,
+                minlength=len(self.category_to_idx),
+            )
+        return self._value_sums
+
+    def csr_layout(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Sort order grouping factors by category, with slice offsets.
+
+        Returns (order, offsets) where factors[order[offsets[c]:offsets[c+1]]]
+        are exactly the factors of category index c. Computed once.
+        """
+        if self._csr_order is None:
+            n_cats = len(self.category_to_idx)
+            self._csr_order = np.argsort(self.category_idx, kind='stable')
+            counts = np.bincount(self.category_idx, minlength=n_cats)
+            offsets = np.zeros(n_cats + 1, dtype=np.intp)
+            np.cumsum(counts, out=offsets[1:])
+            self._csr_offsets = offsets
+        return self._csr_order, self._csr_offsets
+
+    def get_factor_sum_by_category(self, category: str) -> float:
+        """Sum of factor values for a category (0.0 if unknown)."""
+        idx = self.category_to_idx.get(category)
+        if idx is None:
+            return 0.0
+        return float(self.category_value_sums()[idx])
+
+
+def _as_columns(factors) -> Tuple[List[EmissionFactor], np.ndarray, np.ndarray]:
+    """Normalize a factor list or FactorTable into (factors, values, gas_idx)."""
+    if isinstance(factors, FactorTable):
+        return factors.factors, factors.values, factors.gas_idx
+    values, gas_idx = _factor_arrays(factors)
+    return factors, values, gas_idx
+
 
 class EmissionCalculator:
     """Core calculator for greenhouse gas emissions."""
@@ -30,6 +167,17 @@ class EmissionCalculator:
     def __init__(self, gwp_factors: Optional[Dict[GasType, float]] = None):
         """Initialize calculator with GWP factors."""
         self.gwp_factors = gwp_factors or GWP_FACTORS.copy()
+        self._rebuild_gwp_vector()
+
+    def _rebuild_gwp_vector(self):
+        """Rebuild the vectorized GWP lookup table from the current factors.
+
+        Gases without a configured GWP default to 1.0 (counted as already
+        CO2-equivalent) so the kernel stays exception-free.
+        """
+        self._gwp_vec = np.array(
+            [self.gwp_factors.get(gas, 1.0) for gas in GasType], dtype=np.float64
+        )
 
     def calculate_emissions(
         self,
@@ -50,34 +198,34 @@ class EmissionCalculator:
         Returns:
             CalculationRecord with results and audit trail
         """
+        factors, values, gas_idx = _as_columns(factors)
         if not factors:
             raise ValueError("At least one emission factor must be provided")
 
         if calculation_id is None:
-            calculation_id = str(uuid.uuid4())
-
-        results = []
-        total_co2e = 0.0
-
-        for factor in factors:
-            # Calculate raw emission amount
-            emission_amount = activity.quantity * factor.value
+            calculation_id = _next_calculation_id()
 
-            # Calculate CO2 equivalent
-            co2_equivalent = emission_amount * self.gwp_factors[factor.gas]
+        # Vectorized arithmetic: one multiply per column instead of one
+        # bytecode dispatch per factor
+        amounts, co2e, total_co2e = emission_kernel(
+            float(activity.quantity), values, self._gwp_vec[gas_idx]
+        )
+        total_co2e = float(total_co2e)
 
-            result = EmissionResult(
+        results = [
+            EmissionResult(
                 gas=factor.gas,
-                amount=emission_amount,
+                amount=amount,
                 unit=Unit.KG,  # Assume kg for now, could be parameterized
                 co2_equivalent=co2_equivalent,
                 scope=scope,
                 factor_used=factor,
                 activity=activity,
             )
-
-            results.append(result)
-            total_co2e += co2_equivalent
+            for factor, amount, co2_equivalent in zip(
+                factors, amounts.tolist(), co2e.tolist()
+            )
+        ]
 
         record = CalculationRecord(
             calculation_id=calculation_id,
@@ -90,11 +238,72 @@ class EmissionCalculator:
 
         return record
 
+    def calculate_total_co2e(
+        self,
+        activity: ActivityData,
+        factors: List[EmissionFactor],
+    ) -> float:
+        """
+        Calculate only the total CO2 equivalent for an activity.
+
+        Skips building EmissionResult/CalculationRecord objects entirely;
+        use this when only the aggregate number is needed.
+
+        Args:
+            activity: Activity data to calculate emissions for
+            factors: List of emission factors to apply
+
+        Returns:
+            Total emissions in kg CO2e
+        """
+        factors, values, gas_idx = _as_columns(factors)
+        if not factors:
+            raise ValueError("At least one emission factor must be provided")
+
+        _, _, total_co2e = emission_kernel(
+            float(activity.quantity), values, self._gwp_vec[gas_idx]
+        )
+        return float(total_co2e)
+
+    def calculate_category_totals(
+        self,
+        activities: List[ActivityData],
+        table: FactorTable,
+    ) -> np.ndarray:
+        """
+        Aggregate per-activity CO2e totals against a FactorTable.
+
+        Each activity's type is matched exactly against the table's
+        categories; unknown types contribute 0. The gather-multiply-
+        accumulate runs in the compiled parallel kernel when numba is
+        installed, so this is the fastest path for very large batches.
+
+        Args:
+            activities: List of activity data
+            table: Prebuilt structure-of-arrays factor table
+
+        Returns:
+            Array of per-activity totals in kg CO2e
+        """
+        n = len(activities)
+        quantities = np.fromiter(
+            (a.quantity for a in activities), dtype=np.float64, count=n
+        )
+        type_idx = np.fromiter(
+            (table.category_to_idx.get(a.activity_type, -1) for a in activities),
+            dtype=np.intp,
+            count=n,
+        )
+        weighted = table.values * self._gwp_vec[table.gas_idx]
+        order, offsets = table.csr_layout()
+        return aggregate_kernel(quantities, type_idx, weighted[order], offsets)
+
     def calculate_multiple_activities(
         self,
         activities: List[ActivityData],
         factors: List[EmissionFactor],
         scope: Scope,
+        totals_only: bool = False,
     ) -> List[CalculationRecord]:
         """
         Calculate emissions for multiple activities.
@@ -103,26 +312,72 @@ class EmissionCalculator:
             activities: List of activity data
             factors: List of emission factors (will be matched by category/type)
             scope: GHG Protocol scope
+            totals_only: If True, skip building records and return a NumPy
+                array of per-activity totals in kg CO2e
 
         Returns:
-            List of calculation records
+            List of calculation records, or an array of totals when
+            totals_only is set
         """
-        records = []
+        if not activities:
+            return np.empty(0, dtype=np.float64) if totals_only else []
+        factors, values, gas_idx = _as_columns(factors)
+        if not factors:
+            raise ValueError("At least one emission factor must be provided")
 
-        for activity in activities:
-            # Find matching factors for this activity type
-            matching_factors = [
-                f for f in factors
-                if f.category.lower() in activity.activity_type.lower() or
-                activity.activity_type.lower() in f.category.lower()
-            ]
+        index = build_category_index(factors)
+        # Use all factors if no specific match (could be improved)
+        matches = [
+            match_factors_by_category(index, activity.activity_type_lower) or factors
+            for activity in activities
+        ]
+
+        # One 2-D multiply covers every activity x factor pair instead of
+        # a Python loop per activity over a Python loop per factor
+        quantities = np.fromiter(
+            (a.quantity for a in activities), dtype=np.float64, count=len(activities)
+        )
+        gwps = self._gwp_vec[gas_idx]
+        amounts = quantities[:, None] * values[None, :]
+        co2e = amounts * gwps[None, :]
 
-            if not matching_factors:
-                # Use all factors if no specific match (could be improved)
-                matching_factors = factors
+        position = {id(f): j for j, f in enumerate(factors)}
 
-            record = self.calculate_emissions(activity, matching_factors, scope)
-            records.append(record)
+        if totals_only:
+            # Aggregate without allocating any per-result objects
+            totals = np.empty(len(activities), dtype=np.float64)
+            for i, matched in enumerate(matches):
+                cols = [position[id(f)] for f in matched]
+                totals[i] = co2e[i, cols].sum()
+            return totals
+
+        records = []
+        for i, (activity, matched) in enumerate(zip(activities, matches)):
+            cols = [position[id(f)] for f in matched]
+            row_amounts = amounts[i].tolist()
+            row_co2e = co2e[i].tolist()
+            results = [
+                EmissionResult(
+                    gas=factor.gas,
+                    amount=row_amounts[j],
+                    unit=Unit.KG,
+                    co2_equivalent=row_co2e[j],
+                    scope=scope,
+                    factor_used=factor,
+                    activity=activity,
+                )
+                for factor, j in zip(matched, cols)
+            ]
+            records.append(
+                CalculationRecord(
+                    calculation_id=_next_calculation_id(),
+                    activity=activity,
+                    factors_applied=matched,
+                    results=results,
+                    total_co2e=float(co2e[i, cols].sum()),
+                    scope=scope,
+                )
+            )
 
         return records
 
@@ -132,4 +387,5 @@ class EmissionCalculator:
 
     def update_gwp_factors(self, factors: Dict[GasType, float]):
         """Update global warming potential factors."""
-        self.gwp_factors.update(factors)
\ No newline at end of file
+        self.gwp_factors.update(factors)
+        self._rebuild_gwp_vector()
\ No newline at end of file
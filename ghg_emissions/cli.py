@@ -1,6 +1,7 @@
 """Command-line interface for GHG Emissions Calculator."""
 
 import argparse
+import re
 import sys
 from datetime import datetime
 
@@ -10,6 +11,13 @@ from ghg_emissions.models import ActivityData, ReportData, Scope, Unit
 from ghg_emissions.reporting import ReportGenerator
 
 
+SCOPE_MAP = {
+    "scope_1": Scope.SCOPE_1,
+    "scope_2": Scope.SCOPE_2,
+    "scope_3": Scope.SCOPE_3,
+}
+
+
 def create_parser():
     """Create argument parser for CLI."""
     parser = argparse.ArgumentParser(
@@ -125,25 +133,49 @@ def main():
         )
 
         # Determine scope
-        scope_map = {
-            "scope_1": Scope.SCOPE_1,
-            "scope_2": Scope.SCOPE_2,
-            "scope_3": Scope.SCOPE_3
-        }
-        scope = scope_map[args.scope]
-
-        # Find matching factors
-        matching_factors = []
+        scope = SCOPE_MAP[args.scope]
+
+        # Find matching factors with one compiled alternation scan over the
+        # activity string (longest category first so e.g. "natural gas"
+        # beats "gas")
+        activity_lower = args.activity.lower()
+        by_category = {}
         for factor in factors:
-            if factor.category.lower() in args.activity.lower():
-                matching_factors.append(factor)
+            by_category.setdefault(factor.category_lower, []).append(factor)
+
+        category_pattern = re.compile(
+            "|".join(
+                re.escape(c) for c in sorted(by_category, key=len, reverse=True)
+            )
+        )
+        matching_factors = []
+        seen_categories = set()
+        for match in category_pattern.finditer(activity_lower):
+            category = match.group(0)
+            if category not in seen_categories:
+                seen_categories.add(category)
+                matching_factors.extend(by_category[category])
 
         if not matching_factors:
-            # Try broader matching
-            activity_lower = args.activity.lower()
+            # Fall back to matching individual category words
+            word_map = {}
             for factor in factors:
-                if any(word in activity_lower for word in factor.category.lower().split()):
-                    matching_factors.append(factor)
+                for word in factor.category_lower.split():
+                    word_map.setdefault(word, []).append(factor)
+
+            word_pattern = re.compile(
+                r"\b(?:"
+                + "|".join(
+                    re.escape(w) for w in sorted(word_map, key=len, reverse=True)
+                )
+                + r")\b"
+            )
+            seen_ids = set()
+            for match in word_pattern.finditer(activity_lower):
+                for factor in word_map[match.group(0)]:
+                    if id(factor) not in seen_ids:
+                        seen_ids.add(id(factor))
+                        matching_factors.append(factor)
 
         if not matching_factors:
             print(f"Error: No emission factors found for activity type '{args.activity}'")
@@ -170,26 +202,20 @@ Factors applied:
 """
             for factor in record.factors_applied:
                 output += f"- {factor.category}: {factor.value} {factor.unit} ({factor.source})\n"
-        elif args.format == "csv":
-            # Generate CSV report
-            report_data = ReportData(
-                records=[record],
-                period_start=datetime.now().replace(hour=0, minute=0, second=0, microsecond=0),
-                period_end=datetime.now(),
-                organization="CLI Calculation",
-                report_title=f"Emissions for {args.activity}"
-            )
-            output = generator.generate_csv(report_data)
-        elif args.format == "json":
-            # Generate JSON report
+        elif args.format in ("csv", "json"):
+            # CSV and JSON share the same report data; read the clock once
+            now = datetime.now()
             report_data = ReportData(
                 records=[record],
-                period_start=datetime.now().replace(hour=0, minute=0, second=0, microsecond=0),
-                period_end=datetime.now(),
+                period_start=now.replace(hour=0, minute=0, second=0, microsecond=0),
+                period_end=now,
                 organization="CLI Calculation",
                 report_title=f"Emissions for {args.activity}"
             )
-            output = generator.generate_json(report_data)
+            if args.format == "csv":
+                output = generator.generate_csv(report_data)
+            else:
+                output = generator.generate_json(report_data)
         else:
             output = "Unsupported format"
 
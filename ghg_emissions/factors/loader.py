@@ -1,14 +1,20 @@
 """Emission factors loading and management."""
 
-import csv
 import json
+import pickle
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
-import pandas as pd
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional extra
+    orjson = None
 
 from ..models import EmissionFactor, GasType
 
+# Gas name -> enum member, hoisted so parsing avoids Enum.__call__ per row
+_GAS_MAP: Dict[str, GasType] = {g.value: g for g in GasType}
+
 
 class FactorLoader:
     """Loader for emission factors from various sources."""
@@ -18,43 +24,129 @@ class FactorLoader:
         if data_dir is None:
             data_dir = Path(__file__).parent / "data"
         self.data_dir = data_dir
+        # Parsed files keyed by (path, mtime); stale entries are evicted
+        # when the file changes on disk
+        self._file_cache: Dict[Tuple[Path, int], List[EmissionFactor]] = {}
+        self._query_cache: Dict[Tuple[str, object], List[EmissionFactor]] = {}
+
+    def _load_cached(
+        self,
+        filepath: Path,
+        parser: Callable[[Path], List[EmissionFactor]],
+    ) -> List[EmissionFactor]:
+        """Return parsed factors for a file, re-parsing only when it changes."""
+        mtime = filepath.stat().st_mtime_ns
+        key = (filepath, mtime)
+        factors = self._file_cache.get(key)
+        if factors is None:
+            factors = self._read_sidecar(filepath, mtime)
+            if factors is None:
+                factors = parser(filepath)
+                self._write_sidecar(filepath, mtime, factors)
+            for stale in [k for k in self._file_cache if k[0] == filepath]:
+                del self._file_cache[stale]
+            self._file_cache[key] = factors
+            self._query_cache.clear()
+        return factors
+
+    def _sidecar_path(self, filepath: Path) -> Path:
+        """Path of the compiled pickle sidecar for a source factor file."""
+        return self.data_dir / ".cache" / (filepath.name + ".pkl")
+
+    def _read_sidecar(self, filepath: Path, mtime: int) -> Optional[List[EmissionFactor]]:
+        """Load pre-parsed factors from the sidecar if still current."""
+        try:
+            stored_mtime, factors = pickle.loads(
+                self._sidecar_path(filepath).read_bytes()
+            )
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+        if stored_mtime != mtime:
+            return None
+        return factors
+
+    def _write_sidecar(self, filepath: Path, mtime: int, factors: List[EmissionFactor]):
+        """Persist parsed factors next to the source file (best effort)."""
+        path = self._sidecar_path(filepath)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            path.write_bytes(
+                pickle.dumps((mtime, factors), protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        except OSError:
+            # Read-only data directories simply skip the sidecar
+            pass
 
     def load_from_csv(self, filename: str = "factors.csv") -> List[EmissionFactor]:
         """Load emission factors from CSV file."""
-        filepath = self.data_dir / filename
-        factors = []
+        return self._load_cached(self.data_dir / filename, self._parse_csv)
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    gas = GasType(row['gas'])
-                    factor = EmissionFactor(
-                        gas=gas,
-                        value=float(row['value']),
-                        unit=row['unit'],
-                        source=row['source'],
-                        category=row['category'],
-                        description=row.get('description'),
-                    )
-                    factors.append(factor)
-                except (ValueError, KeyError) as e:
-                    print(f"Warning: Skipping invalid factor row: {row} - {e}")
-                    continue
+    def _parse_csv(self, filepath: Path) -> List[EmissionFactor]:
+        """Parse emission factors from a CSV file."""
+        # Imported here so CLI startup only pays for pandas when a CSV is
+        # actually parsed
+        import pandas as pd
 
-        return factors
+        try:
+            df = pd.read_csv(filepath)
+        except pd.errors.EmptyDataError:
+            return []
+
+        required = {'gas', 'value', 'unit', 'source', 'category'}
+        missing = required - set(df.columns)
+        if missing:
+            print(f"Warning: Factor file {filepath} missing columns: {sorted(missing)}")
+            return []
+
+        if 'description' not in df.columns:
+            df['description'] = None
+
+        # Validate whole columns up front instead of try/except per row
+        gases = df['gas'].map(_GAS_MAP)
+        values = pd.to_numeric(df['value'], errors='coerce')
+        valid = gases.notna() & values.notna() & (values >= 0)
+
+        for _, row in df[~valid].iterrows():
+            print(f"Warning: Skipping invalid factor row: {row.to_dict()}")
+
+        descriptions = df['description'].astype(object).where(df['description'].notna(), None)
+
+        return [
+            EmissionFactor(
+                gas=gas,
+                value=float(value),
+                unit=unit,
+                source=source,
+                category=category,
+                description=description,
+            )
+            for gas, value, unit, source, category, description in zip(
+                gases[valid],
+                values[valid],
+                df.loc[valid, 'unit'],
+                df.loc[valid, 'source'],
+                df.loc[valid, 'category'],
+                descriptions[valid],
+            )
+        ]
 
     def load_from_json(self, filename: str = "factors.json") -> List[EmissionFactor]:
         """Load emission factors from JSON file."""
-        filepath = self.data_dir / filename
+        return self._load_cached(self.data_dir / filename, self._parse_json)
+
+    def _parse_json(self, filepath: Path) -> List[EmissionFactor]:
+        """Parse emission factors from a JSON file."""
         factors = []
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(filepath.read_bytes())
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
 
         for item in data:
             try:
-                gas = GasType(item['gas'])
+                gas = _GAS_MAP[item['gas']]
                 factor = EmissionFactor(
                     gas=gas,
                     value=float(item['value']),
@@ -91,13 +183,23 @@ class FactorLoader:
 
     def get_factors_by_category(self, category: str) -> List[EmissionFactor]:
         """Get factors for a specific category."""
+        # Loading first lets a changed file invalidate stale query results
         all_factors = self.load_standard_factors()
-        return [f for f in all_factors if f.category.lower() == category.lower()]
+        category_lower = category.lower()
+        key = ('category', category_lower)
+        if key not in self._query_cache:
+            self._query_cache[key] = [
+                f for f in all_factors if f.category_lower == category_lower
+            ]
+        return self._query_cache[key]
 
     def get_factors_by_gas(self, gas: GasType) -> List[EmissionFactor]:
         """Get factors for a specific gas."""
         all_factors = self.load_standard_factors()
-        return [f for f in all_factors if f.gas == gas]
+        key = ('gas', gas)
+        if key not in self._query_cache:
+            self._query_cache[key] = [f for f in all_factors if f.gas == gas]
+        return self._query_cache[key]
 
     def search_factors(self, query: str) -> List[EmissionFactor]:
         """Search factors by category or description."""
@@ -105,6 +207,6 @@ class FactorLoader:
         query_lower = query.lower()
         return [
             f for f in all_factors
-            if query_lower in f.category.lower() or
-            (f.description and query_lower in f.description.lower())
+            if query_lower in f.category_lower or
+            (f.description_lower and query_lower in f.description_lower)
         ]
\ No newline at end of file
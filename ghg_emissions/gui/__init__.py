@@ -2,8 +2,17 @@
 
 This package provides a graphical user interface for entering emission recipes
 and displaying calculated results.
+
+The application class is imported lazily so that importing this package
+(e.g. for the Qt-free ``models``/``utils`` modules) does not load PyQt6.
 """
 
-from .app import GHGCalculatorApp
+__all__ = ["GHGCalculatorApp"]
+
 
-__all__ = ["GHGCalculatorApp"]
\ No newline at end of file
+def __getattr__(name):
+    """Load the Qt-backed application class only when first accessed."""
+    if name == "GHGCalculatorApp":
+        from .app import GHGCalculatorApp
+        return GHGCalculatorApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
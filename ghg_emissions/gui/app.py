@@ -4,26 +4,58 @@ import sys
 from typing import List, Optional
 from datetime import datetime
 
+import numpy as np
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QFormLayout, QGroupBox, QLabel, QLineEdit, QComboBox, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox, QFileDialog,
+    QTableView, QHeaderView, QMessageBox, QFileDialog,
     QTextEdit, QSplitter
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
 
 from ..calculator import EmissionCalculator
 from ..factors import FactorLoader
-from ..models import ActivityData, Scope, Unit, ReportData
+from ..models import Scope, Unit, ReportData
 from ..reporting import ReportGenerator
 from .models import GUIActivity, GUIResult
+from .table_model import EmissionsTableModel
 from .utils import validate_activity_input, format_emission_result
 
 
+class CalcWorker(QObject):
+    """Runs the vectorized emission computation off the GUI thread."""
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, quantities, per_unit_co2e):
+        """Capture the input columns for the background computation."""
+        super().__init__()
+        self._quantities = quantities
+        self._per_unit_co2e = per_unit_co2e
+
+    def run(self):
+        """Compute per-activity CO2e and emit the result array."""
+        try:
+            self.finished.emit(self._quantities * self._per_unit_co2e)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
 class GHGCalculatorApp(QMainWindow):
     """Main GUI application class using PyQt6."""
 
+    # Export dispatch: format name -> (unbound generator method, file mode).
+    # Binary-mode entries stream straight into the open file; text-mode
+    # entries return a string to write.
+    _EXPORTERS = {
+        "csv": (ReportGenerator.generate_csv, "w"),
+        "json": (ReportGenerator.generate_json, "w"),
+        "pdf": (ReportGenerator.write_pdf, "wb"),
+    }
+
     def __init__(self):
         """Initialize the GUI application."""
         super().__init__()
@@ -38,10 +70,30 @@ class GHGCalculatorApp(QMainWindow):
         # Load standard factors
         self.factors = self.factor_loader.load_standard_factors()
 
+        # One pass over the loaded factors builds every per-category
+        # structure the UI needs: the kg CO2e per unit lookup table for
+        # vectorized calculation, the category index, and the sorted
+        # activity types for the combo box
+        self._factor_lut: dict = {}
+        self._factors_by_cat: dict = {}
+        gwp = self.calculator.gwp_factors
+        for factor in self.factors:
+            self._factor_lut[factor.category] = (
+                self._factor_lut.get(factor.category, 0.0)
+                + factor.value * gwp.get(factor.gas, 1.0)
+            )
+            self._factors_by_cat.setdefault(factor.category, []).append(factor)
+        self._activity_types = sorted(self._factors_by_cat)
+
         # GUI state
         self.activities: List[GUIActivity] = []
         self.results: List[GUIResult] = []
 
+        # Background calculation state
+        self._calc_thread: Optional[QThread] = None
+        self._calc_worker: Optional[CalcWorker] = None
+        self._calc_activities: List[GUIActivity] = []
+
         # Setup UI
         self._setup_ui()
 
@@ -117,10 +169,10 @@ class GHGCalculatorApp(QMainWindow):
 
         layout = QVBoxLayout(results_group)
 
-        # Results table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(4)
-        self.results_table.setHorizontalHeaderLabels(["Activity", "Quantity", "Unit", "CO2e (kg)"])
+        # Results table: a model-backed view renders only visible rows
+        self.results_model = EmissionsTableModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         self.results_table.horizontalHeader().setStretchLastSection(True)
         self.results_table.setAlternatingRowColors(True)
         layout.addWidget(self.results_table)
@@ -135,9 +187,9 @@ class GHGCalculatorApp(QMainWindow):
         """Create action buttons."""
         button_layout = QHBoxLayout()
 
-        calculate_button = QPushButton("Calculate")
-        calculate_button.clicked.connect(self._calculate_emissions)
-        button_layout.addWidget(calculate_button)
+        self.calculate_button = QPushButton("Calculate")
+        self.calculate_button.clicked.connect(self._calculate_emissions)
+        button_layout.addWidget(self.calculate_button)
 
         clear_button = QPushButton("Clear All")
         clear_button.clicked.connect(self._clear_all)
@@ -159,7 +211,7 @@ class GHGCalculatorApp(QMainWindow):
 
     def _get_activity_types(self) -> List[str]:
         """Get available activity types from factors."""
-        return list(set(f.category for f in self.factors))
+        return self._activity_types
 
     def _add_activity(self):
         """Add an activity to the list."""
@@ -196,62 +248,77 @@ class GHGCalculatorApp(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to add activity: {str(e)}")
 
     def _calculate_emissions(self):
-        """Calculate emissions for all activities."""
+        """Calculate emissions for all activities on a worker thread."""
         if not self.activities:
             QMessageBox.warning(self, "No Activities", "Please add at least one activity before calculating.")
             return
-
-        try:
-            # Clear previous results
-            self.results_table.setRowCount(0)
-            self.results = []
-            total_co2e = 0.0
-
-            for activity in self.activities:
-                # Convert to ActivityData
-                activity_data = ActivityData(
-                    activity_type=activity.activity_type,
-                    quantity=activity.quantity,
-                    unit=activity.unit,
-                    description=activity.description
-                )
-
-                # Calculate emissions
-                record = self.calculator.calculate_emissions(
-                    activity=activity_data,
-                    factors=[f for f in self.factors if f.category == activity.activity_type],
-                    scope=activity.scope
-                )
-
-                # Create GUI result
-                gui_result = GUIResult(
-                    activity=activity,
-                    total_co2e=record.total_co2e,
-                    breakdown=record.results
-                )
-
-                self.results.append(gui_result)
-                total_co2e += record.total_co2e
-
-                # Add to table
-                row = self.results_table.rowCount()
-                self.results_table.insertRow(row)
-                self.results_table.setItem(row, 0, QTableWidgetItem(activity.activity_type))
-                self.results_table.setItem(row, 1, QTableWidgetItem(f"{activity.quantity:.2f}"))
-                self.results_table.setItem(row, 2, QTableWidgetItem(activity.unit.value))
-                self.results_table.setItem(row, 3, QTableWidgetItem(f"{record.total_co2e:.2f}"))
-
-            # Update total
-            self.total_label.setText(f"Total CO2e: {total_co2e:.2f} kg")
-
-        except Exception as e:
-            QMessageBox.critical(self, "Calculation Error", f"Failed to calculate emissions: {str(e)}")
+        if self._calc_thread is not None:
+            return  # A calculation is already running
+
+        # Structure-of-arrays batch: one vectorized multiply covers
+        # every activity instead of a per-activity calculator call
+        self._calc_activities = list(self.activities)
+        n = len(self._calc_activities)
+        quantities = np.fromiter(
+            (a.quantity for a in self._calc_activities), dtype=np.float64, count=n
+        )
+        per_unit_co2e = np.fromiter(
+            (self._factor_lut.get(a.activity_type, 0.0) for a in self._calc_activities),
+            dtype=np.float64,
+            count=n,
+        )
+
+        # Keep the UI responsive while the batch computes
+        self.calculate_button.setEnabled(False)
+        self._calc_thread = QThread(self)
+        self._calc_worker = CalcWorker(quantities, per_unit_co2e)
+        self._calc_worker.moveToThread(self._calc_thread)
+        self._calc_thread.started.connect(self._calc_worker.run)
+        self._calc_worker.finished.connect(self._on_calc_done)
+        self._calc_worker.failed.connect(self._on_calc_failed)
+        self._calc_thread.start()
+
+    def _finish_calc_thread(self):
+        """Tear down the worker thread and re-enable the Calculate button."""
+        if self._calc_thread is not None:
+            self._calc_thread.quit()
+            self._calc_thread.wait()
+        self._calc_thread = None
+        self._calc_worker = None
+        self.calculate_button.setEnabled(True)
+
+    def _on_calc_done(self, co2e):
+        """Populate results and table from the worker's CO2e array."""
+        activities = self._calc_activities
+        total_co2e = float(co2e.sum())
+
+        self.results = [
+            GUIResult(activity=activity, total_co2e=activity_co2e, breakdown=[])
+            for activity, activity_co2e in zip(activities, co2e.tolist())
+        ]
+
+        # One model reset replaces per-row table item population
+        self.results_model.set_results(
+            [a.activity_type for a in activities],
+            np.fromiter((a.quantity for a in activities), dtype=np.float64, count=len(activities)),
+            [a.unit.value for a in activities],
+            co2e,
+        )
+
+        # Update total
+        self.total_label.setText(f"Total CO2e: {total_co2e:.2f} kg")
+        self._finish_calc_thread()
+
+    def _on_calc_failed(self, message: str):
+        """Report a calculation failure from the worker thread."""
+        QMessageBox.critical(self, "Calculation Error", f"Failed to calculate emissions: {message}")
+        self._finish_calc_thread()
 
     def _clear_all(self):
         """Clear all activities and results."""
         self.activities.clear()
         self.results.clear()
-        self.results_table.setRowCount(0)
+        self.results_model.clear()
         self.total_label.setText("Total CO2e: 0.00 kg")
 
     def _export_results(self, format_type: str):
@@ -274,29 +341,27 @@ class GHGCalculatorApp(QMainWindow):
                 return
 
             # Create report data (simplified - in real implementation, reconstruct records)
+            now = datetime.now()
             report_data = ReportData(
                 records=[],  # Would need to reconstruct from results
-                period_start=datetime.now(),
-                period_end=datetime.now(),
+                period_start=now,
+                period_end=now,
                 organization="GUI User",
                 report_title="GHG Emissions Report"
             )
 
-            # Generate report
-            if format_type == "csv":
-                report = self.report_generator.generate_csv(report_data)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(report)
-            elif format_type == "json":
-                report = self.report_generator.generate_json(report_data)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(report)
-            elif format_type == "pdf":
-                report = self.report_generator.generate_pdf(report_data)
-                with open(file_path, 'wb') as f:
-                    f.write(report)
-            else:
+            # Generate report via the dispatch table
+            try:
+                generate, mode = self._EXPORTERS[format_type]
+            except KeyError:
                 raise ValueError(f"Unsupported format: {format_type}")
+            if 'b' in mode:
+                with open(file_path, mode, buffering=1 << 20) as f:
+                    generate(self.report_generator, report_data, f)
+            else:
+                report = generate(self.report_generator, report_data)
+                with open(file_path, mode, encoding='utf-8') as f:
+                    f.write(report)
 
             QMessageBox.information(self, "Export Success", f"Results exported to {file_path}")
 
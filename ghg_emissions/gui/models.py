@@ -6,7 +6,7 @@ from typing import List, Optional
 from ..models import ActivityData, Scope, Unit, EmissionResult
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GUIActivity:
     """GUI representation of an activity."""
     activity_type: str
@@ -25,7 +25,7 @@ class GUIActivity:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GUIResult:
     """GUI representation of calculation results."""
     activity: GUIActivity
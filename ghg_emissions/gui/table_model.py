@@ -0,0 +1,68 @@
+"""Model-backed results table for the GHG Emissions Calculator GUI."""
+
+import numpy as np
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from .utils import format_batch
+
+
+class EmissionsTableModel(QAbstractTableModel):
+    """Table model serving result rows straight from NumPy columns.
+
+    The view only asks for visible cells, so rendering cost is O(visible
+    rows) regardless of how many results are held, and no per-row Qt item
+    objects are allocated.
+    """
+
+    HEADERS = ("Activity", "Quantity", "Unit", "CO2e")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._activity_types = np.empty(0, dtype=object)
+        self._quantities = np.empty(0, dtype=np.float64)
+        self._units = np.empty(0, dtype=object)
+        self._co2e = np.empty(0, dtype=np.float64)
+        self._co2e_text = []
+
+    def set_results(self, activity_types, quantities, units, co2e):
+        """Swap in new result columns with a single model reset."""
+        self.beginResetModel()
+        self._activity_types = np.asarray(activity_types, dtype=object)
+        self._quantities = np.asarray(quantities, dtype=np.float64)
+        self._units = np.asarray(units, dtype=object)
+        self._co2e = np.asarray(co2e, dtype=np.float64)
+        # Formatted once for the whole column instead of per data() call
+        self._co2e_text = format_batch(self._co2e)
+        self.endResetModel()
+
+    def clear(self):
+        """Remove all result rows."""
+        self.set_results((), (), (), ())
+
+    def rowCount(self, parent=QModelIndex()):
+        """Number of result rows."""
+        return 0 if parent.isValid() else self._co2e.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        """Number of table columns."""
+        return len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Format cell text on demand from the backing arrays."""
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        row, col = index.row(), index.column()
+        if col == 0:
+            return str(self._activity_types[row])
+        if col == 1:
+            return f"{self._quantities[row]:.2f}"
+        if col == 2:
+            return str(self._units[row])
+        return self._co2e_text[row]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Column header labels."""
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal):
+            return self.HEADERS[section]
+        return None
@@ -1,11 +1,23 @@
 """Utility functions for GHG Emissions Calculator GUI."""
 
 import re
-from typing import Optional
+from typing import List, Optional
+
+import numpy as np
 
 from ..models import Unit, Scope
 from .models import GUIActivity
 
+# Characters rejected in export paths / replaced in filenames, compiled once
+_INVALID_CHARS_RE = re.compile(r'[<>:"|?*]')
+
+# Enum lookup tables built once at import; validation then avoids both
+# Enum.__call__ and rebuilding the choice lists per error message
+_UNIT_VALUES = tuple(u.value for u in Unit)
+_SCOPE_VALUES = tuple(s.value for s in Scope)
+_UNIT_MAP = {u.value: u for u in Unit}
+_SCOPE_MAP = {s.value: s for s in Scope}
+
 
 def validate_activity_input(activity_type: str, quantity: str, unit: str,
                           scope: str, description: str) -> GUIActivity:
@@ -42,16 +54,14 @@ def validate_activity_input(activity_type: str, quantity: str, unit: str,
         raise ValueError("Quantity must be a valid number")
 
     # Validate unit
-    try:
-        unit_val = Unit(unit)
-    except ValueError:
-        raise ValueError(f"Invalid unit: {unit}. Must be one of {[u.value for u in Unit]}")
+    unit_val = _UNIT_MAP.get(unit)
+    if unit_val is None:
+        raise ValueError(f"Invalid unit: {unit}. Must be one of {list(_UNIT_VALUES)}")
 
     # Validate scope
-    try:
-        scope_val = Scope(scope)
-    except ValueError:
-        raise ValueError(f"Invalid scope: {scope}. Must be one of {[s.value for s in Scope]}")
+    scope_val = _SCOPE_MAP.get(scope)
+    if scope_val is None:
+        raise ValueError(f"Invalid scope: {scope}. Must be one of {list(_SCOPE_VALUES)}")
 
     # Validate description (optional)
     description_val = description.strip() if description else None
@@ -81,6 +91,25 @@ def format_emission_result(total_co2e: float, unit: str = "kg") -> str:
         return f"{total_co2e:.2f} {unit} CO2e"
 
 
+def format_batch(co2e: np.ndarray) -> List[str]:
+    """Format an array of emission results for display in one pass.
+
+    Vectorizes the kg/tonne threshold of format_emission_result so a
+    whole results column is formatted without per-row Python branching.
+
+    Args:
+        co2e: Array of CO2 equivalent emissions in kg
+
+    Returns:
+        List of formatted strings, one per element
+    """
+    co2e = np.asarray(co2e, dtype=np.float64)
+    mask = co2e >= 1000
+    vals = np.where(mask, co2e / 1000, co2e)
+    units = np.where(mask, 'tonnes', 'kg')
+    return [f"{v:.2f} {u} CO2e" for v, u in zip(vals.tolist(), units.tolist())]
+
+
 def validate_file_path(file_path: str) -> bool:
     """Validate file path for export.
 
@@ -94,11 +123,7 @@ def validate_file_path(file_path: str) -> bool:
         return False
 
     # Basic validation - check for invalid characters
-    invalid_chars = ['<', '>', ':', '"', '|', '?', '*']
-    if any(char in file_path for char in invalid_chars):
-        return False
-
-    return True
+    return _INVALID_CHARS_RE.search(file_path) is None
 
 
 def sanitize_filename(filename: str) -> str:
@@ -111,7 +136,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Replace invalid characters with underscores
-    sanitized = re.sub(r'[<>:"|?*]', '_', filename)
+    sanitized = _INVALID_CHARS_RE.sub('_', filename)
     # Remove leading/trailing whitespace and dots
     sanitized = sanitized.strip(' .')
     # Ensure not empty
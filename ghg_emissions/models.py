@@ -1,5 +1,6 @@
 """Core data structures for GHG emissions calculator."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -33,7 +34,7 @@ class Scope(Enum):
     SCOPE_3 = "Scope 3"
 
 
-@dataclass
+@dataclass(slots=True)
 class EmissionFactor:
     """Emission factor data structure."""
     gas: GasType
@@ -44,14 +45,23 @@ class EmissionFactor:
     description: Optional[str] = None
     valid_from: Optional[datetime] = None
     valid_to: Optional[datetime] = None
+    # Lowercase forms cached once for the hot matching and search paths
+    category_lower: str = field(init=False, repr=False, compare=False, default="")
+    description_lower: Optional[str] = field(
+        init=False, repr=False, compare=False, default=None
+    )
 
     def __post_init__(self):
         """Validate emission factor."""
         if self.value < 0:
             raise ValueError("Emission factor value must be non-negative")
+        # Interned categories make hot == comparisons a pointer check
+        self.category = sys.intern(self.category)
+        self.category_lower = sys.intern(self.category.lower())
+        self.description_lower = self.description.lower() if self.description else None
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivityData:
     """Activity data for emissions calculation."""
     activity_type: str
@@ -59,14 +69,38 @@ class ActivityData:
     unit: Unit
     description: Optional[str] = None
     metadata: Dict[str, Union[str, float, int]] = field(default_factory=dict)
+    # Lowercase activity type cached once for the hot matching paths
+    activity_type_lower: str = field(init=False, repr=False, compare=False, default="")
 
     def __post_init__(self):
         """Validate activity data."""
         if self.quantity < 0:
             raise ValueError("Activity quantity must be non-negative")
-
-
-@dataclass
+        self.activity_type = sys.intern(self.activity_type)
+        self.activity_type_lower = sys.intern(self.activity_type.lower())
+
+    @classmethod
+    def unchecked(cls, activity_type: str, quantity: float, unit: Unit,
+                  description: Optional[str] = None,
+                  metadata: Optional[Dict[str, Union[str, float, int]]] = None
+                  ) -> "ActivityData":
+        """Build an activity without re-running validation.
+
+        For bulk construction from inputs that are already validated
+        (e.g. GUI forms or a parsed file); the caller guarantees that
+        quantity is non-negative.
+        """
+        obj = cls.__new__(cls)
+        obj.activity_type = sys.intern(activity_type)
+        obj.quantity = quantity
+        obj.unit = unit
+        obj.description = description
+        obj.metadata = metadata if metadata is not None else {}
+        obj.activity_type_lower = sys.intern(activity_type.lower())
+        return obj
+
+
+@dataclass(slots=True)
 class EmissionResult:
     """Result of emissions calculation."""
     gas: GasType
@@ -86,7 +120,7 @@ class EmissionResult:
             raise ValueError("CO2 equivalent must be non-negative")
 
 
-@dataclass
+@dataclass(slots=True)
 class CalculationRecord:
     """Audit trail for emissions calculation."""
     calculation_id: str
@@ -107,7 +141,7 @@ class CalculationRecord:
             raise ValueError("Total CO2e must be non-negative")
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportData:
     """Data for generating reports."""
     records: List[CalculationRecord]
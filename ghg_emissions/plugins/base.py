@@ -1,7 +1,8 @@
 """Plugin system for extending GHG emissions calculator."""
 
+import itertools
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 
 from ..models import EmissionFactor
 
@@ -64,22 +65,37 @@ class PluginManager:
         """Initialize plugin manager."""
         self.factor_providers: Dict[str, FactorProvider] = {}
         self.calculator_plugins: Dict[str, CalculatorPlugin] = {}
+        # Provider answers cached until the provider set changes
+        self._category_cache: Optional[FrozenSet[str]] = None
+        self._factor_cache: Dict[Optional[str], List[EmissionFactor]] = {}
 
     def register_factor_provider(self, provider: FactorProvider):
         """Register a factor provider plugin."""
         self.factor_providers[provider.name] = provider
+        self._category_cache = None
+        self._factor_cache.clear()
 
     def register_calculator_plugin(self, plugin: CalculatorPlugin):
         """Register a calculator plugin."""
         self.calculator_plugins[plugin.name] = plugin
 
+    def reset(self):
+        """Remove all registered providers and plugins."""
+        self.factor_providers.clear()
+        self.calculator_plugins.clear()
+        self._category_cache = None
+        self._factor_cache.clear()
+
     def get_all_factors(self, category: Optional[str] = None) -> List[EmissionFactor]:
         """Get factors from all registered providers."""
-        all_factors = []
-        for provider in self.factor_providers.values():
-            factors = provider.get_factors(category)
-            all_factors.extend(factors)
-        return all_factors
+        if category not in self._factor_cache:
+            self._factor_cache[category] = list(
+                itertools.chain.from_iterable(
+                    provider.get_factors(category)
+                    for provider in self.factor_providers.values()
+                )
+            )
+        return self._factor_cache[category]
 
     def get_factors_by_provider(self, provider_name: str) -> List[EmissionFactor]:
         """Get factors from a specific provider."""
@@ -89,10 +105,14 @@ class PluginManager:
 
     def get_available_categories(self) -> List[str]:
         """Get all available categories from providers."""
-        categories = set()
-        for provider in self.factor_providers.values():
-            categories.update(provider.get_categories())
-        return sorted(list(categories))
+        if self._category_cache is None:
+            self._category_cache = frozenset(
+                itertools.chain.from_iterable(
+                    provider.get_categories()
+                    for provider in self.factor_providers.values()
+                )
+            )
+        return sorted(self._category_cache)
 
     def list_factor_providers(self) -> List[str]:
         """List names of registered factor providers."""
@@ -1,5 +1,6 @@
 """Plugin discovery and loading."""
 
+import importlib
 import importlib.metadata
 from typing import List
 
@@ -46,18 +47,20 @@ def discover_plugins() -> PluginManager:
 
 def load_plugin_from_module(module_name: str, manager: PluginManager):
     """Load a plugin from a Python module."""
+    bases = (
+        (FactorProvider, manager.register_factor_provider),
+        (CalculatorPlugin, manager.register_calculator_plugin),
+    )
     try:
-        module = __import__(module_name, fromlist=[''])
-        # Look for plugin classes in the module
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
-            if isinstance(attr, type):
-                if issubclass(attr, FactorProvider) and attr != FactorProvider:
-                    provider = attr()
-                    manager.register_factor_provider(provider)
-                elif issubclass(attr, CalculatorPlugin) and attr != CalculatorPlugin:
-                    plugin = attr()
-                    manager.register_calculator_plugin(plugin)
+        module = importlib.import_module(module_name)
+        # Single pass over the module dict instead of dir() + getattr per name
+        for attr in vars(module).values():
+            if not isinstance(attr, type):
+                continue
+            for base, register in bases:
+                if issubclass(attr, base) and attr is not base:
+                    register(attr())
+                    break
     except Exception as e:
         print(f"Error loading plugin from module {module_name}: {e}")
 
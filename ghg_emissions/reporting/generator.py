@@ -2,11 +2,21 @@
 
 import csv
 import json
+import threading
+from collections import namedtuple
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from io import BytesIO, StringIO
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional extra
+    orjson = None
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional
 
-from jinja2 import Template
+from jinja2 import Environment, FileSystemLoader, Template
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet
@@ -15,19 +25,185 @@ from reportlab.platypus import Paragraph, SimpleDocTemplate, Table, TableStyle
 from ..models import CalculationRecord, ReportData
 
 
+# Everything the text and PDF reports need from one walk over the records
+_Aggregate = namedtuple('_Aggregate', ['total_co2e', 'scope_totals', 'detail_rows'])
+
+
+# Text summary layout, compiled to template bytecode once at import
+_SUMMARY_TEMPLATE_SRC = """
+GHG Emissions Report
+====================
+
+Organization: {{ organization }}
+Report Title: {{ report_title }}
+Period: {{ period_start }} to {{ period_end }}
+Generated: {{ generated_at }}
+
+Summary:
+--------
+Total Calculations: {{ total_records }}
+Total CO2 Equivalent: {{ "%.2f"|format(total_co2e) }} kg
+
+Breakdown by Scope:
+{% for scope, total in scope_totals.items() %}
+- {{ scope }}: {{ "%.2f"|format(total) }} kg CO2e
+{% endfor %}
+
+Detailed Records:
+{% for activity_type, _, co2e in detail_rows %}
+{{ loop.index }}. {{ activity_type }}: {{ "%.2f"|format(co2e) }} kg CO2e
+{% endfor %}"""
+
+_SUMMARY_TEMPLATE = Template(
+    _SUMMARY_TEMPLATE_SRC, trim_blocks=True, lstrip_blocks=True
+)
+
+
+# Shared executors for save_report_async, created on first use: a worker
+# process pool for CPU-bound PDF rendering and a small thread pool for
+# write-dominated text formats
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_write_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    global _pdf_pool
+    if _pdf_pool is None:
+        with _pool_lock:
+            if _pdf_pool is None:
+                _pdf_pool = ProcessPoolExecutor()
+    return _pdf_pool
+
+
+def _get_write_pool() -> ThreadPoolExecutor:
+    global _write_pool
+    if _write_pool is None:
+        with _pool_lock:
+            if _write_pool is None:
+                _write_pool = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix='report-writer'
+                )
+    return _write_pool
+
+
+def _render_pdf_to_file(report_data: ReportData, path: str) -> str:
+    """Render and write a PDF in a worker process; returns the path."""
+    generator = ReportGenerator()
+    with open(path, 'wb', buffering=1 << 20) as f:
+        generator.write_pdf(report_data, f)
+    return path
+
+
+def _record_to_dict(record: CalculationRecord, iso_cache: dict) -> Dict:
+    """Build the JSON-ready dict view of one calculation record.
+
+    Shaped to the known model fields with direct attribute reads, so no
+    generic dataclass introspection runs per record.
+    """
+    activity = record.activity
+    return {
+        'calculation_id': record.calculation_id,
+        'activity': {
+            'type': activity.activity_type,
+            'quantity': activity.quantity,
+            'unit': activity.unit.value,
+            'description': activity.description,
+            'metadata': activity.metadata
+        },
+        'scope': record.scope.value,
+        'total_co2e': record.total_co2e,
+        'factors_applied': [
+            {
+                'gas': f.gas.value,
+                'value': f.value,
+                'unit': f.unit,
+                'source': f.source,
+                'category': f.category,
+                'description': f.description
+            } for f in record.factors_applied
+        ],
+        'results': [
+            {
+                'gas': r.gas.value,
+                'amount': r.amount,
+                'unit': r.unit.value,
+                'co2_equivalent': r.co2_equivalent,
+                'calculated_at': _iso_cached(r.calculated_at, iso_cache)
+            } for r in record.results
+        ],
+        'calculated_at': _iso_cached(record.calculated_at, iso_cache),
+        'notes': record.notes
+    }
+
+
+def _iso_cached(timestamp, cache: dict) -> str:
+    """Format a datetime as ISO 8601, memoizing repeats.
+
+    Results produced in one batch share timestamps, so the same value
+    would otherwise be re-serialized once per row.
+    """
+    iso = cache.get(timestamp)
+    if iso is None:
+        iso = cache[timestamp] = timestamp.isoformat()
+    return iso
+
+
 class ReportGenerator:
     """Generator for GHG emissions reports in multiple formats."""
 
+    # TableStyles are immutable once built; construct them a single time
+    # at class definition instead of per generate_pdf call
+    _SUMMARY_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 14),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+    _RESULTS_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+
     def __init__(self, template_dir: Optional[Path] = None):
         """Initialize generator with template directory."""
         if template_dir is None:
             template_dir = Path(__file__).parent / "templates"
         self.template_dir = template_dir
         self.template_dir.mkdir(exist_ok=True)
+        # Stylesheet construction is not cheap; build it once per generator
+        self._styles = getSampleStyleSheet()
+        # Template environment with auto_reload off: templates are parsed
+        # once and cached by the environment, with no stat() per render
+        self._jinja_env = Environment(
+            loader=FileSystemLoader(str(self.template_dir)),
+            autoescape=True,
+            auto_reload=False,
+        )
+
+    def get_template(self, name: str) -> Template:
+        """Load a template from the template directory.
+
+        Compiled templates are cached by the environment, so repeat
+        renders only execute the template bytecode.
+        """
+        return self._jinja_env.get_template(name)
+
+    def generate_csv(self, report_data: ReportData,
+                     fileobj=None) -> Optional[str]:
+        """Generate CSV report.
 
-    def generate_csv(self, report_data: ReportData) -> str:
-        """Generate CSV report."""
-        output = StringIO()
+        When fileobj is provided, rows stream straight into it and None
+        is returned; otherwise the CSV is returned as a string.
+        """
+        output = fileobj if fileobj is not None else StringIO()
         writer = csv.writer(output)
 
         # Header
@@ -37,26 +213,48 @@ class ReportGenerator:
             'Factor Source', 'Calculated At'
         ])
 
-        # Data rows
+        # Data rows: per-record invariants are read once, and all rows go
+        # through a single writerows call instead of one writerow per result
+        rows = []
+        iso_cache = {}
         for record in report_data.records:
+            if not record.results:
+                # Nothing to emit; skip the per-record field reads
+                continue
+            calc_id = record.calculation_id
+            activity = record.activity
+            activity_type = activity.activity_type
+            quantity = activity.quantity
+            unit_value = activity.unit.value
+            scope_value = record.scope.value
             for result in record.results:
-                writer.writerow([
-                    record.calculation_id,
-                    record.activity.activity_type,
-                    record.activity.quantity,
-                    record.activity.unit.value,
+                rows.append((
+                    calc_id,
+                    activity_type,
+                    quantity,
+                    unit_value,
                     result.gas.value,
                     result.amount,
                     result.co2_equivalent,
-                    record.scope.value,
+                    scope_value,
                     result.factor_used.source,
-                    result.calculated_at.isoformat()
-                ])
+                    _iso_cached(result.calculated_at, iso_cache)
+                ))
+        writer.writerows(rows)
 
+        if fileobj is not None:
+            return None
         return output.getvalue()
 
-    def generate_json(self, report_data: ReportData) -> str:
-        """Generate JSON report."""
+    def generate_json(self, report_data: ReportData,
+                      pretty: bool = False) -> str:
+        """Generate JSON report.
+
+        Compact by default -- indentation roughly doubles the output and
+        costs extra serialization time; pass pretty=True for
+        human-readable two-space indenting.
+        """
+        iso_cache = {}
         data = {
             'report_title': report_data.report_title,
             'organization': report_data.organization,
@@ -66,88 +264,82 @@ class ReportGenerator:
             },
             'generated_at': report_data.generated_at.isoformat(),
             'metadata': report_data.metadata,
-            'records': []
+            'records': [
+                _record_to_dict(record, iso_cache)
+                for record in report_data.records
+            ]
         }
 
-        for record in report_data.records:
-            record_data = {
-                'calculation_id': record.calculation_id,
-                'activity': {
-                    'type': record.activity.activity_type,
-                    'quantity': record.activity.quantity,
-                    'unit': record.activity.unit.value,
-                    'description': record.activity.description,
-                    'metadata': record.activity.metadata
-                },
-                'scope': record.scope.value,
-                'total_co2e': record.total_co2e,
-                'factors_applied': [
-                    {
-                        'gas': f.gas.value,
-                        'value': f.value,
-                        'unit': f.unit,
-                        'source': f.source,
-                        'category': f.category,
-                        'description': f.description
-                    } for f in record.factors_applied
-                ],
-                'results': [
-                    {
-                        'gas': r.gas.value,
-                        'amount': r.amount,
-                        'unit': r.unit.value,
-                        'co2_equivalent': r.co2_equivalent,
-                        'calculated_at': r.calculated_at.isoformat()
-                    } for r in record.results
-                ],
-                'calculated_at': record.calculated_at.isoformat(),
-                'notes': record.notes
-            }
-            data['records'].append(record_data)
-
-        return json.dumps(data, indent=2)
+        # orjson serializes in native code, roughly an order of magnitude
+        # faster than stdlib json on large reports
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            return orjson.dumps(data, option=option).decode()
+        return json.dumps(data, indent=2 if pretty else None,
+                          separators=None if pretty else (',', ':'))
 
-    def generate_summary_text(self, report_data: ReportData) -> str:
-        """Generate text summary report."""
-        total_co2e = sum(r.total_co2e for r in report_data.records)
-        total_records = len(report_data.records)
-
-        summary = f"""
-GHG Emissions Report
-====================
-
-Organization: {report_data.organization}
-Report Title: {report_data.report_title}
-Period: {report_data.period_start.date()} to {report_data.period_end.date()}
-Generated: {report_data.generated_at}
-
-Summary:
---------
-Total Calculations: {total_records}
-Total CO2 Equivalent: {total_co2e:.2f} kg
-
-Breakdown by Scope:
-"""
-
-        scope_totals = {}
-        for record in report_data.records:
-            scope = record.scope.value
-            scope_totals[scope] = scope_totals.get(scope, 0) + record.total_co2e
+    def _aggregate(self, records: List[CalculationRecord]) -> _Aggregate:
+        """Collect report totals in a single pass over the records.
 
-        for scope, total in scope_totals.items():
-            summary += f"- {scope}: {total:.2f} kg CO2e\n"
+        Returns the grand total, per-scope totals, and one
+        (activity_type, scope_value, total_co2e) row per record, so each
+        generator walks the record list exactly once.
+        """
+        # One pass extracts the columns; the reductions then run as
+        # vectorized C loops instead of per-record Python arithmetic
+        activity_types = []
+        scope_values = []
+        co2e_list = []
+        for record in records:
+            activity_types.append(record.activity.activity_type)
+            scope_values.append(record.scope.value)
+            co2e_list.append(record.total_co2e)
 
-        summary += "\nDetailed Records:\n"
-        for i, record in enumerate(report_data.records, 1):
-            summary += f"{i}. {record.activity.activity_type}: {record.total_co2e:.2f} kg CO2e\n"
+        co2e = np.asarray(co2e_list, dtype=np.float64)
+        total_co2e = float(co2e.sum())
+        if records:
+            labels, inverse = np.unique(
+                np.asarray(scope_values, dtype=object), return_inverse=True
+            )
+            sums = np.bincount(inverse, weights=co2e, minlength=labels.shape[0])
+            scope_totals = dict(zip(labels.tolist(), sums.tolist()))
+        else:
+            scope_totals = {}
+        detail_rows = list(zip(activity_types, scope_values, co2e.tolist()))
+        return _Aggregate(total_co2e, scope_totals, detail_rows)
 
-        return summary
+    def generate_summary_text(self, report_data: ReportData) -> str:
+        """Generate text summary report."""
+        agg = self._aggregate(report_data.records)
+        # The precompiled template renders in one pass; the loops run as
+        # template bytecode rather than repeated Python string building
+        return _SUMMARY_TEMPLATE.render(
+            organization=report_data.organization,
+            report_title=report_data.report_title,
+            period_start=report_data.period_start.date(),
+            period_end=report_data.period_end.date(),
+            generated_at=report_data.generated_at,
+            total_records=len(report_data.records),
+            total_co2e=agg.total_co2e,
+            scope_totals=agg.scope_totals,
+            detail_rows=agg.detail_rows,
+        )
 
     def generate_pdf(self, report_data: ReportData) -> bytes:
-        """Generate PDF report."""
+        """Generate PDF report as bytes."""
         buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter)
-        styles = getSampleStyleSheet()
+        self.write_pdf(report_data, buffer)
+        return buffer.getvalue()
+
+    def write_pdf(self, report_data: ReportData, fp: BinaryIO) -> None:
+        """Write a PDF report directly into a binary file-like object.
+
+        Streaming into the destination avoids holding a second full copy
+        of the document in memory, which matters for large reports.
+        """
+        doc = SimpleDocTemplate(fp, pagesize=letter)
+        styles = self._styles
+        agg = self._aggregate(report_data.records)
         elements = []
 
         # Title
@@ -163,67 +355,80 @@ Breakdown by Scope:
         elements.append(Paragraph(header_text, styles['Normal']))
 
         # Summary table
-        total_co2e = sum(r.total_co2e for r in report_data.records)
         summary_data = [
             ['Metric', 'Value'],
             ['Total Calculations', str(len(report_data.records))],
-            ['Total CO2 Equivalent (kg)', f"{total_co2e:.2f}"]
+            ['Total CO2 Equivalent (kg)', f"{agg.total_co2e:.2f}"]
         ]
 
         summary_table = Table(summary_data)
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 14),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        summary_table.setStyle(self._SUMMARY_STYLE)
         elements.append(summary_table)
 
         # Detailed results table
-        if report_data.records:
+        if agg.detail_rows:
             table_data = [['Activity', 'Scope', 'CO2e (kg)']]
-            for record in report_data.records:
-                table_data.append([
-                    record.activity.activity_type,
-                    record.scope.value,
-                    f"{record.total_co2e:.2f}"
-                ])
+            table_data.extend(
+                [activity_type, scope_value, f"{co2e:.2f}"]
+                for activity_type, scope_value, co2e in agg.detail_rows
+            )
 
             results_table = Table(table_data)
-            results_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            results_table.setStyle(self._RESULTS_STYLE)
             elements.append(results_table)
 
         doc.build(elements)
-        buffer.seek(0)
-        return buffer.getvalue()
 
-    def save_report(self, report_data: ReportData, filename: str, format: str = 'csv'):
+    def save_report(self, report_data: ReportData, filename: str,
+                    format: str = 'csv', pretty: bool = False):
         """Save report to file in specified format."""
+        # 1 MiB buffers: multi-MB reports would otherwise flush through
+        # the default ~8 KiB buffer one small syscall at a time
+        buffering = 1 << 20
         if format.lower() == 'csv':
-            content = self.generate_csv(report_data)
-            with open(f"{filename}.csv", 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Stream rows into the file rather than materializing the
+            # whole report as one string first
+            with open(f"{filename}.csv", 'w', encoding='utf-8', newline='',
+                      buffering=buffering) as f:
+                self.generate_csv(report_data, fileobj=f)
         elif format.lower() == 'json':
-            content = self.generate_json(report_data)
-            with open(f"{filename}.json", 'w', encoding='utf-8') as f:
+            content = self.generate_json(report_data, pretty=pretty)
+            with open(f"{filename}.json", 'w', encoding='utf-8',
+                      buffering=buffering) as f:
                 f.write(content)
         elif format.lower() == 'pdf':
-            content = self.generate_pdf(report_data)
-            with open(f"{filename}.pdf", 'wb') as f:
-                f.write(content)
+            # Build straight into the file; no BytesIO/bytes copies
+            with open(f"{filename}.pdf", 'wb', buffering=buffering) as f:
+                self.write_pdf(report_data, f)
         elif format.lower() == 'txt':
             content = self.generate_summary_text(report_data)
-            with open(f"{filename}.txt", 'w', encoding='utf-8') as f:
+            with open(f"{filename}.txt", 'w', encoding='utf-8',
+                      buffering=buffering) as f:
                 f.write(content)
         else:
-            raise ValueError(f"Unsupported format: {format}")
\ No newline at end of file
+            raise ValueError(f"Unsupported format: {format}")
+
+    def save_report_async(self, report_data: ReportData, filename: str,
+                          format: str = 'csv', pretty: bool = False) -> Future:
+        """Save a report in the background without blocking the caller.
+
+        PDF rendering is CPU-bound pure Python, so it runs in a worker
+        process and parallelizes across cores despite the GIL; the text
+        formats are write-dominated and run on a shared writer thread.
+
+        Returns:
+            Future resolving to the written file path
+        """
+        fmt = format.lower()
+        if fmt == 'pdf':
+            return _get_pdf_pool().submit(
+                _render_pdf_to_file, report_data, f"{filename}.pdf"
+            )
+        if fmt not in ('csv', 'json', 'txt'):
+            raise ValueError(f"Unsupported format: {format}")
+
+        def _write() -> str:
+            self.save_report(report_data, filename, fmt, pretty=pretty)
+            return f"{filename}.{fmt}"
+
+        return _get_write_pool().submit(_write)
\ No newline at end of file
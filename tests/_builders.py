@@ -0,0 +1,84 @@
+"""Deterministic test-data builders shared by unit tests and benchmarks.
+
+Every builder derives its values from a seeded random.Random, so the
+same seed always yields the same object graph. Scaling tests and future
+bench_*.py modules can grow n_records / n_results without duplicating
+construction code in fixtures.
+"""
+
+import random
+from datetime import datetime
+
+from ghg_emissions.models import (
+    ActivityData,
+    CalculationRecord,
+    EmissionFactor,
+    EmissionResult,
+    GasType,
+    ReportData,
+    Scope,
+    Unit,
+)
+
+_CATEGORIES = ["Electricity", "Transportation", "Heating", "Waste"]
+
+
+def build_factor(rng):
+    """Build one emission factor from the given RNG."""
+    return EmissionFactor(
+        gas=GasType.CO2,
+        value=round(rng.uniform(0.1, 2.0), 4),
+        unit="kg CO2 per kWh",
+        source="Builder",
+        category=rng.choice(_CATEGORIES),
+    )
+
+
+def build_activity(rng):
+    """Build one activity from the given RNG."""
+    return ActivityData(
+        activity_type=f"Activity {rng.randrange(1000)}",
+        quantity=round(rng.uniform(1.0, 10_000.0), 2),
+        unit=Unit.KWH,
+    )
+
+
+def build_result(rng, factor, activity):
+    """Build one emission result for a factor/activity pair."""
+    co2e = round(factor.value * activity.quantity, 4)
+    return EmissionResult(
+        gas=factor.gas,
+        amount=co2e,
+        unit=Unit.KG,
+        co2_equivalent=co2e,
+        scope=rng.choice(list(Scope)),
+        factor_used=factor,
+        activity=activity,
+    )
+
+
+def build_record(n_results=1, seed=0):
+    """Build one calculation record with n_results results."""
+    rng = random.Random(seed)
+    activity = build_activity(rng)
+    factors = [build_factor(rng) for _ in range(n_results)]
+    results = [build_result(rng, f, activity) for f in factors]
+    return CalculationRecord(
+        calculation_id=f"rec-{seed}",
+        activity=activity,
+        factors_applied=factors,
+        results=results,
+        total_co2e=sum(r.co2_equivalent for r in results),
+        scope=results[0].scope,
+    )
+
+
+def build_report(n_records=1, seed=0):
+    """Build a report with n_records single-result records."""
+    return ReportData(
+        records=[build_record(seed=seed + i) for i in range(n_records)],
+        period_start=datetime(2023, 1, 1),
+        period_end=datetime(2023, 12, 31),
+        organization="Builder Org",
+        report_title="Builder Report",
+    )
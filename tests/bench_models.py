@@ -0,0 +1,73 @@
+"""Microbenchmarks for dataclass construction cost.
+
+Named bench_*.py so default pytest collection skips this module; run it
+explicitly with pytest-benchmark installed:
+
+    pytest tests/bench_models.py --benchmark-only
+
+Tracks __post_init__ validation overhead in the core dataclasses so
+regressions show up in benchmark history rather than in user workloads.
+"""
+
+from ghg_emissions.models import (
+    ActivityData,
+    EmissionFactor,
+    EmissionResult,
+    GasType,
+    Scope,
+    Unit,
+)
+
+_FACTOR = EmissionFactor(
+    gas=GasType.CO2, value=0.5, unit="kg CO2 per kWh",
+    source="Benchmark", category="Electricity",
+)
+_ACTIVITY = ActivityData(
+    activity_type="Electricity Usage", quantity=1000.0, unit=Unit.KWH
+)
+
+
+def test_bench_emission_factor(benchmark):
+    """Benchmark validated EmissionFactor construction."""
+    benchmark(
+        EmissionFactor,
+        gas=GasType.CO2,
+        value=0.5,
+        unit="kg CO2 per kWh",
+        source="Benchmark",
+        category="Electricity",
+    )
+
+
+def test_bench_activity_data(benchmark):
+    """Benchmark validated ActivityData construction."""
+    benchmark(
+        ActivityData,
+        activity_type="Electricity Usage",
+        quantity=1000.0,
+        unit=Unit.KWH,
+    )
+
+
+def test_bench_activity_data_unchecked(benchmark):
+    """Benchmark the validation-free ActivityData.unchecked path."""
+    benchmark(
+        ActivityData.unchecked,
+        "Electricity Usage",
+        1000.0,
+        Unit.KWH,
+    )
+
+
+def test_bench_emission_result(benchmark):
+    """Benchmark validated EmissionResult construction."""
+    benchmark(
+        EmissionResult,
+        gas=GasType.CO2,
+        amount=500.0,
+        unit=Unit.KG,
+        co2_equivalent=500.0,
+        scope=Scope.SCOPE_2,
+        factor_used=_FACTOR,
+        activity=_ACTIVITY,
+    )
@@ -0,0 +1,80 @@
+"""Shared fixtures for the test suite.
+
+The model object graph used across test modules is built once per
+session; tests treat these objects as read-only.
+"""
+
+import pytest
+from datetime import datetime
+
+from ghg_emissions.models import (
+    ActivityData,
+    CalculationRecord,
+    EmissionFactor,
+    EmissionResult,
+    GasType,
+    ReportData,
+    Scope,
+    Unit,
+)
+
+
+@pytest.fixture(scope="session")
+def factor():
+    """Canonical valid emission factor."""
+    return EmissionFactor(
+        gas=GasType.CO2,
+        value=0.5,
+        unit="kg CO2 per kWh",
+        source="Test Source",
+        category="Electricity"
+    )
+
+
+@pytest.fixture(scope="session")
+def activity():
+    """Canonical valid activity."""
+    return ActivityData(
+        activity_type="Electricity Usage",
+        quantity=1000.0,
+        unit=Unit.KWH
+    )
+
+
+@pytest.fixture(scope="session")
+def result(factor, activity):
+    """Canonical valid emission result."""
+    return EmissionResult(
+        gas=GasType.CO2,
+        amount=500.0,
+        unit=Unit.KG,
+        co2_equivalent=500.0,
+        scope=Scope.SCOPE_2,
+        factor_used=factor,
+        activity=activity
+    )
+
+
+@pytest.fixture(scope="session")
+def record(factor, activity, result):
+    """Canonical valid calculation record."""
+    return CalculationRecord(
+        calculation_id="test-123",
+        activity=activity,
+        factors_applied=[factor],
+        results=[result],
+        total_co2e=500.0,
+        scope=Scope.SCOPE_2
+    )
+
+
+@pytest.fixture(scope="session")
+def report_data(record):
+    """Canonical report covering one calculation record."""
+    return ReportData(
+        records=[record],
+        period_start=datetime(2023, 1, 1),
+        period_end=datetime(2023, 12, 31),
+        organization="Test Org",
+        report_title="Test GHG Report"
+    )
@@ -1,5 +1,7 @@
 """Integration tests for the GHG emissions calculator."""
 
+import json
+
 import pytest
 from datetime import datetime
 
@@ -132,7 +134,7 @@ class TestIntegration:
         assert "Test Company" in text_report
         assert "Annual GHG Emissions Report" in text_report
 
-        assert '"organization": "Test Company"' in json_report
+        assert json.loads(json_report)["organization"] == "Test Company"
 
         assert 'Activity Type' in csv_report
         assert 'Electricity Usage' in csv_report
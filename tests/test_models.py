@@ -1,7 +1,6 @@
 """Tests for core data models."""
 
 import pytest
-from datetime import datetime
 
 from ghg_emissions.models import (
     ActivityData,
@@ -14,6 +13,25 @@ from ghg_emissions.models import (
 )
 
 
+# Canonical valid instances built once at import, used as ready inputs
+# wherever the object under test is something else.
+_CANON_FACTOR = EmissionFactor(
+    gas=GasType.CO2, value=1.0, unit="test", source="test", category="test"
+)
+_CANON_ACTIVITY = ActivityData(
+    activity_type="test", quantity=1.0, unit=Unit.KG
+)
+_CANON_RESULT = EmissionResult(
+    gas=GasType.CO2,
+    amount=1.0,
+    unit=Unit.KG,
+    co2_equivalent=1.0,
+    scope=Scope.SCOPE_1,
+    factor_used=_CANON_FACTOR,
+    activity=_CANON_ACTIVITY,
+)
+
+
 class TestEmissionFactor:
     """Test EmissionFactor dataclass."""
 
@@ -29,18 +47,6 @@ class TestEmissionFactor:
         assert factor.gas == GasType.CO2
         assert factor.value == 0.5
 
-    def test_negative_value_raises_error(self):
-        """Test that negative values raise ValueError."""
-        with pytest.raises(ValueError, match="Emission factor value must be non-negative"):
-            EmissionFactor(
-                gas=GasType.CO2,
-                value=-0.1,
-                unit="kg CO2 per kWh",
-                source="Test",
-                category="Test"
-            )
-
-
 class TestActivityData:
     """Test ActivityData dataclass."""
 
@@ -54,126 +60,66 @@ class TestActivityData:
         assert activity.quantity == 1000.0
         assert activity.unit == Unit.KWH
 
-    def test_negative_quantity_raises_error(self):
-        """Test that negative quantities raise ValueError."""
-        with pytest.raises(ValueError, match="Activity quantity must be non-negative"):
-            ActivityData(
-                activity_type="Test",
-                quantity=-10.0,
-                unit=Unit.KWH
-            )
-
-
 class TestEmissionResult:
     """Test EmissionResult dataclass."""
 
-    def test_valid_emission_result(self):
-        """Test creating a valid emission result."""
-        factor = EmissionFactor(
-            gas=GasType.CO2,
-            value=0.5,
-            unit="kg CO2 per kWh",
-            source="Test",
-            category="Electricity"
-        )
-        activity = ActivityData(
-            activity_type="Electricity",
-            quantity=100.0,
-            unit=Unit.KWH
-        )
-
-        result = EmissionResult(
-            gas=GasType.CO2,
-            amount=50.0,
-            unit=Unit.KG,
-            co2_equivalent=50.0,
-            scope=Scope.SCOPE_2,
-            factor_used=factor,
-            activity=activity
-        )
-        assert result.amount == 50.0
-        assert result.co2_equivalent == 50.0
-
-    def test_negative_amount_raises_error(self):
-        """Test that negative amounts raise ValueError."""
-        factor = EmissionFactor(gas=GasType.CO2, value=1.0, unit="test", source="test", category="test")
-        activity = ActivityData(activity_type="test", quantity=1.0, unit=Unit.KG)
-
-        with pytest.raises(ValueError, match="Emission amount must be non-negative"):
-            EmissionResult(
-                gas=GasType.CO2,
-                amount=-10.0,
-                unit=Unit.KG,
-                co2_equivalent=0.0,
-                scope=Scope.SCOPE_1,
-                factor_used=factor,
-                activity=activity
-            )
-
+    def test_valid_emission_result(self, result):
+        """Test the shared valid emission result."""
+        assert result.amount == 500.0
+        assert result.co2_equivalent == 500.0
+        assert result.gas == GasType.CO2
 
 class TestCalculationRecord:
     """Test CalculationRecord dataclass."""
 
-    def test_valid_calculation_record(self):
-        """Test creating a valid calculation record."""
-        factor = EmissionFactor(gas=GasType.CO2, value=1.0, unit="test", source="test", category="test")
-        activity = ActivityData(activity_type="test", quantity=1.0, unit=Unit.KG)
-        result = EmissionResult(
-            gas=GasType.CO2,
-            amount=1.0,
-            unit=Unit.KG,
-            co2_equivalent=1.0,
-            scope=Scope.SCOPE_1,
-            factor_used=factor,
-            activity=activity
-        )
-
-        record = CalculationRecord(
-            calculation_id="test-123",
-            activity=activity,
-            factors_applied=[factor],
-            results=[result],
-            total_co2e=1.0,
-            scope=Scope.SCOPE_1
-        )
+    def test_valid_calculation_record(self, record):
+        """Test the shared valid calculation record."""
         assert record.calculation_id == "test-123"
         assert len(record.results) == 1
 
-    def test_empty_results_raises_error(self):
-        """Test that empty results raise ValueError."""
-        activity = ActivityData(activity_type="test", quantity=1.0, unit=Unit.KG)
-        factor = EmissionFactor(gas=GasType.CO2, value=1.0, unit="test", source="test", category="test")
-
-        with pytest.raises(ValueError, match="Calculation must have at least one result"):
-            CalculationRecord(
-                calculation_id="test",
-                activity=activity,
-                factors_applied=[factor],
-                results=[],
-                total_co2e=0.0,
-                scope=Scope.SCOPE_1
-            )
-
-    def test_negative_total_co2e_raises_error(self):
-        """Test that negative total CO2e raises ValueError."""
-        activity = ActivityData(activity_type="test", quantity=1.0, unit=Unit.KG)
-        factor = EmissionFactor(gas=GasType.CO2, value=1.0, unit="test", source="test", category="test")
-        result = EmissionResult(
-            gas=GasType.CO2,
-            amount=1.0,
-            unit=Unit.KG,
-            co2_equivalent=1.0,
-            scope=Scope.SCOPE_1,
-            factor_used=factor,
-            activity=activity
-        )
-
-        with pytest.raises(ValueError, match="Total CO2e must be non-negative"):
-            CalculationRecord(
-                calculation_id="test",
-                activity=activity,
-                factors_applied=[factor],
-                results=[result],
-                total_co2e=-1.0,
-                scope=Scope.SCOPE_1
-            )
\ No newline at end of file
+class TestValidation:
+    """Test that __post_init__ validation rejects invalid construction."""
+
+    @pytest.mark.parametrize("cls,kwargs,err", [
+        pytest.param(
+            EmissionFactor,
+            dict(gas=GasType.CO2, value=-0.1, unit="kg CO2 per kWh",
+                 source="Test", category="Test"),
+            "Emission factor value must be non-negative",
+            id="factor-negative-value",
+        ),
+        pytest.param(
+            ActivityData,
+            dict(activity_type="Test", quantity=-10.0, unit=Unit.KWH),
+            "Activity quantity must be non-negative",
+            id="activity-negative-quantity",
+        ),
+        pytest.param(
+            EmissionResult,
+            dict(gas=GasType.CO2, amount=-10.0, unit=Unit.KG,
+                 co2_equivalent=0.0, scope=Scope.SCOPE_1,
+                 factor_used=_CANON_FACTOR, activity=_CANON_ACTIVITY),
+            "Emission amount must be non-negative",
+            id="result-negative-amount",
+        ),
+        pytest.param(
+            CalculationRecord,
+            dict(calculation_id="test", activity=_CANON_ACTIVITY,
+                 factors_applied=[_CANON_FACTOR], results=[],
+                 total_co2e=0.0, scope=Scope.SCOPE_1),
+            "Calculation must have at least one result",
+            id="record-empty-results",
+        ),
+        pytest.param(
+            CalculationRecord,
+            dict(calculation_id="test", activity=_CANON_ACTIVITY,
+                 factors_applied=[_CANON_FACTOR], results=[_CANON_RESULT],
+                 total_co2e=-1.0, scope=Scope.SCOPE_1),
+            "Total CO2e must be non-negative",
+            id="record-negative-total",
+        ),
+    ])
+    def test_invalid_construction_rejected(self, cls, kwargs, err):
+        """Test that invalid field values raise ValueError."""
+        with pytest.raises(ValueError, match=err):
+            cls(**kwargs)
\ No newline at end of file
@@ -13,6 +13,17 @@ from ghg_emissions.models import EmissionFactor, GasType
 class MockFactorProvider(FactorProvider):
     """Mock factor provider for testing."""
 
+    # Stateless test data, built once at import instead of per call
+    _FACTORS = [
+        EmissionFactor(
+            gas=GasType.CO2,
+            value=0.5,
+            unit="kg CO2 per unit",
+            source="Mock",
+            category="Test"
+        )
+    ]
+
     @property
     def name(self):
         return "mock_provider"
@@ -22,18 +33,9 @@ class MockFactorProvider(FactorProvider):
         return "1.0.0"
 
     def get_factors(self, category=None):
-        factors = [
-            EmissionFactor(
-                gas=GasType.CO2,
-                value=0.5,
-                unit="kg CO2 per unit",
-                source="Mock",
-                category="Test"
-            )
-        ]
         if category:
-            return [f for f in factors if f.category == category]
-        return factors
+            return [f for f in self._FACTORS if f.category == category]
+        return list(self._FACTORS)
 
     def get_categories(self):
         return ["Test"]
@@ -57,11 +59,17 @@ class MockCalculatorPlugin(CalculatorPlugin):
 class TestPluginManager:
     """Test PluginManager class."""
 
-    @pytest.fixture
-    def manager(self):
-        """Create plugin manager instance."""
+    @pytest.fixture(scope="module")
+    def manager_base(self):
+        """One plugin manager instance shared by the module."""
         return PluginManager()
 
+    @pytest.fixture
+    def manager(self, manager_base):
+        """The shared manager, reset to empty for each test."""
+        manager_base.reset()
+        return manager_base
+
     @pytest.fixture
     def mock_provider(self):
         """Create mock factor provider."""
@@ -72,6 +80,12 @@ class TestPluginManager:
         """Create mock calculator plugin."""
         return MockCalculatorPlugin()
 
+    @pytest.fixture
+    def registered_manager(self, manager, mock_provider):
+        """Manager with the mock factor provider already registered."""
+        manager.register_factor_provider(mock_provider)
+        return manager
+
     def test_register_factor_provider(self, manager, mock_provider):
         """Test registering a factor provider."""
         manager.register_factor_provider(mock_provider)
@@ -88,35 +102,27 @@ class TestPluginManager:
         assert plugin is not None
         assert plugin.name == "mock_calculator"
 
-    def test_get_factors_by_provider(self, manager, mock_provider):
+    def test_get_factors_by_provider(self, registered_manager):
         """Test getting factors from specific provider."""
-        manager.register_factor_provider(mock_provider)
-
-        factors = manager.get_factors_by_provider("mock_provider")
+        factors = registered_manager.get_factors_by_provider("mock_provider")
         assert len(factors) == 1
         assert factors[0].gas == GasType.CO2
 
-    def test_get_all_factors(self, manager, mock_provider):
+    def test_get_all_factors(self, registered_manager):
         """Test getting all factors from registered providers."""
-        manager.register_factor_provider(mock_provider)
-
-        all_factors = manager.get_all_factors()
+        all_factors = registered_manager.get_all_factors()
         assert len(all_factors) == 1
 
-    def test_get_available_categories(self, manager, mock_provider):
+    def test_get_available_categories(self, registered_manager):
         """Test getting available categories."""
-        manager.register_factor_provider(mock_provider)
-
-        categories = manager.get_available_categories()
+        categories = registered_manager.get_available_categories()
         assert "Test" in categories
 
-    def test_get_factors_by_category(self, manager, mock_provider):
+    def test_get_factors_by_category(self, registered_manager):
         """Test filtering factors by category."""
-        manager.register_factor_provider(mock_provider)
-
-        factors = manager.get_all_factors(category="Test")
+        factors = registered_manager.get_all_factors(category="Test")
         assert len(factors) == 1
 
         # Test non-existent category
-        factors = manager.get_all_factors(category="NonExistent")
+        factors = registered_manager.get_all_factors(category="NonExistent")
         assert len(factors) == 0
\ No newline at end of file
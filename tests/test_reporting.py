@@ -1,91 +1,71 @@
 """Tests for report generation."""
 
+import csv
+import json
+import re
+
 import pytest
-from datetime import datetime
 from io import StringIO
 
 from ghg_emissions.reporting import ReportGenerator
-from ghg_emissions.models import (
-    ActivityData,
-    CalculationRecord,
-    EmissionFactor,
-    EmissionResult,
-    GasType,
-    ReportData,
-    Scope,
-    Unit,
-)
+
+# Compiled once; pulls the grand total out of the text summary
+_TOTAL_CO2E_RE = re.compile(r"Total CO2 Equivalent: ([\d.]+) kg")
 
 
 class TestReportGenerator:
-    """Test ReportGenerator class."""
+    """Test ReportGenerator class.
 
-    @pytest.fixture
+    The sample object graph comes from the shared session-scoped
+    fixtures in conftest.py; report_data covers one record.
+    """
+
+    @pytest.fixture(scope="module")
     def generator(self):
-        """Create report generator instance."""
+        """Create report generator instance, shared across the module."""
         return ReportGenerator()
 
-    @pytest.fixture
-    def sample_report_data(self):
-        """Create sample report data for testing."""
-        factor = EmissionFactor(
-            gas=GasType.CO2,
-            value=0.5,
-            unit="kg CO2 per kWh",
-            source="Test Source",
-            category="Electricity"
-        )
-        activity = ActivityData(
-            activity_type="Electricity Usage",
-            quantity=1000.0,
-            unit=Unit.KWH
-        )
-        result = EmissionResult(
-            gas=GasType.CO2,
-            amount=500.0,
-            unit=Unit.KG,
-            co2_equivalent=500.0,
-            scope=Scope.SCOPE_2,
-            factor_used=factor,
-            activity=activity
-        )
-        record = CalculationRecord(
-            calculation_id="test-123",
-            activity=activity,
-            factors_applied=[factor],
-            results=[result],
-            total_co2e=500.0,
-            scope=Scope.SCOPE_2
-        )
-
-        return ReportData(
-            records=[record],
-            period_start=datetime(2023, 1, 1),
-            period_end=datetime(2023, 12, 31),
-            organization="Test Org",
-            report_title="Test GHG Report"
-        )
-
-    def test_generate_csv(self, generator, sample_report_data):
-        """Test CSV report generation."""
-        csv_content = generator.generate_csv(sample_report_data)
+    # Each report format is generated once per module and the tests
+    # assert against the cached artifact
 
-        # Check that it's valid CSV
-        lines = csv_content.strip().split('\n')
-        assert len(lines) == 2  # Header + 1 data row
+    @pytest.fixture(scope="module")
+    def csv_text(self, generator, report_data):
+        """CSV report text."""
+        return generator.generate_csv(report_data)
+
+    @pytest.fixture(scope="module")
+    def json_obj(self, generator, report_data):
+        """Parsed JSON report."""
+        return json.loads(generator.generate_json(report_data))
+
+    @pytest.fixture(scope="module")
+    def summary_text(self, generator, report_data):
+        """Text summary report."""
+        return generator.generate_summary_text(report_data)
+
+    @pytest.fixture(scope="module")
+    def pdf_bytes(self, generator, report_data):
+        """Rendered PDF report."""
+        return generator.generate_pdf(report_data)
+
+    def test_generate_csv(self, csv_text):
+        """Test CSV report generation."""
+        # Parse once and assert on exact fields; also catches
+        # column-order regressions that substring scans would miss
+        rows = list(csv.reader(StringIO(csv_text)))
+        assert len(rows) == 2  # Header + 1 data row
 
         # Check header
-        assert 'Calculation ID' in lines[0]
-        assert 'Activity Type' in lines[0]
+        assert rows[0][0] == 'Calculation ID'
+        assert rows[0][1] == 'Activity Type'
 
         # Check data
-        assert 'test-123' in lines[1]
-        assert 'Electricity Usage' in lines[1]
+        assert rows[1][0] == 'test-123'
+        assert rows[1][1] == 'Electricity Usage'
 
-    def test_generate_json(self, generator, sample_report_data):
+    def test_generate_json(self, json_obj):
         """Test JSON report generation."""
-        json_content = generator.generate_json(sample_report_data)
-        data = json.loads(json_content)
+        data = json_obj
 
         assert data['report_title'] == 'Test GHG Report'
         assert data['organization'] == 'Test Org'
@@ -93,37 +73,66 @@ class TestReportGenerator:
         assert data['records'][0]['calculation_id'] == 'test-123'
         assert data['records'][0]['total_co2e'] == 500.0
 
-    def test_generate_summary_text(self, generator, sample_report_data):
+    def test_generate_summary_text(self, summary_text):
         """Test text summary generation."""
-        summary = generator.generate_summary_text(sample_report_data)
+        summary = summary_text
 
         assert 'Test GHG Report' in summary
         assert 'Test Org' in summary
-        assert '500.0 kg' in summary
         assert 'Electricity Usage' in summary
 
-    def test_generate_pdf(self, generator, sample_report_data):
-        """Test PDF report generation."""
-        pdf_bytes = generator.generate_pdf(sample_report_data)
+        match = _TOTAL_CO2E_RE.search(summary)
+        assert match is not None
+        assert float(match.group(1)) == 500.0
 
-        # Check that we got bytes (basic check)
+    @pytest.mark.slow
+    def test_generate_pdf(self, pdf_bytes):
+        """Test PDF report generation."""
         assert isinstance(pdf_bytes, bytes)
-        assert len(pdf_bytes) > 0
+        # Structural checks: a golden digest is not viable because
+        # reportlab embeds creation timestamps, so the bytes differ
+        # between runs even for identical input
+        assert pdf_bytes.startswith(b'%PDF-')
+        assert pdf_bytes.rstrip().endswith(b'%%EOF')
+
+    @pytest.mark.parametrize("fmt", [
+        "csv",
+        "json",
+        "txt",
+        pytest.param("pdf", marks=pytest.mark.slow),
+    ])
+    def test_save_report(self, generator, report_data, tmp_path, fmt):
+        """Test saving reports to file across all supported formats."""
+        filename = tmp_path / "test_report"
+        generator.save_report(report_data, str(filename), format=fmt)
 
-        # Could check PDF header, but for now just ensure it's not empty
+        saved = tmp_path / f"test_report.{fmt}"
+        assert saved.exists()
+        assert saved.stat().st_size > 0
 
-    def test_save_report_csv(self, generator, sample_report_data, tmp_path):
-        """Test saving CSV report to file."""
-        filename = tmp_path / "test_report"
-        generator.save_report(sample_report_data, str(filename), format='csv')
+    def test_save_report_csv_in_memory(self, generator, report_data,
+                                       monkeypatch):
+        """Test saved CSV content without touching the filesystem."""
+        buf = StringIO()
+        buf.close = lambda: None  # keep contents readable after save
+        monkeypatch.setattr("builtins.open", lambda *args, **kwargs: buf)
+
+        generator.save_report(report_data, "test_report", format='csv')
+
+        content = buf.getvalue()
+        assert 'Calculation ID' in content
+        assert 'test-123' in content
 
-        assert (tmp_path / "test_report.csv").exists()
+    @pytest.mark.slow
+    def test_generate_csv_scales(self, generator):
+        """Test CSV generation against a larger deterministic report."""
+        from tests._builders import build_report
 
-        with open(tmp_path / "test_report.csv", 'r') as f:
-            content = f.read()
-            assert 'Calculation ID' in content
+        report = build_report(n_records=1000)
+        rows = list(csv.reader(StringIO(generator.generate_csv(report))))
+        assert len(rows) == 1001  # Header + one row per record
 
-    def test_save_report_invalid_format(self, generator, sample_report_data):
+    def test_save_report_invalid_format(self, generator, report_data):
         """Test saving with invalid format raises error."""
         with pytest.raises(ValueError, match="Unsupported format"):
-            generator.save_report(sample_report_data, "test", format="invalid")
\ No newline at end of file
+            generator.save_report(report_data, "test", format="invalid")
\ No newline at end of file